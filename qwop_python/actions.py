@@ -11,6 +11,12 @@ Action space:
 
 import itertools
 
+# Bit assigned to each key in an action's key mask
+KEY_Q = 0b0001
+KEY_W = 0b0010
+KEY_O = 0b0100
+KEY_P = 0b1000
+
 
 class ActionMapper:
     """
@@ -43,6 +49,24 @@ class ActionMapper:
         self.reduced_action_set = reduced_action_set
         self.action_to_keys = self._build_action_map()
         self.num_actions = len(self.action_to_keys)
+
+        # 4-bit key mask per action (KEY_Q | KEY_W | KEY_O | KEY_P) and its inverse
+        self.action_masks = [
+            self._keys_to_mask(keys['q'], keys['w'], keys['o'], keys['p'])
+            for keys in self.action_to_keys
+        ]
+        self._mask_to_action = {mask: i for i, mask in enumerate(self.action_masks)}
+
+        # (q_down, w_down, o_down, p_down) per action, unpacked by apply_action
+        self._control_states = [
+            (bool(mask & KEY_Q), bool(mask & KEY_W), bool(mask & KEY_O), bool(mask & KEY_P))
+            for mask in self.action_masks
+        ]
+
+    @staticmethod
+    def _keys_to_mask(q, w, o, p):
+        """Pack Q/W/O/P key states into a 4-bit mask."""
+        return (KEY_Q if q else 0) | (KEY_W if w else 0) | (KEY_O if o else 0) | (KEY_P if p else 0)
     
     def _build_action_map(self):
         """
@@ -104,13 +128,9 @@ class ActionMapper:
         if action_index < 0 or action_index >= self.num_actions:
             raise ValueError(f"Action index {action_index} out of range [0, {self.num_actions-1}]")
         
-        keys = self.action_to_keys[action_index]
-        
         # Set all key states on controls handler
-        controls_handler.q_down = keys['q']
-        controls_handler.w_down = keys['w']
-        controls_handler.o_down = keys['o']
-        controls_handler.p_down = keys['p']
+        (controls_handler.q_down, controls_handler.w_down,
+         controls_handler.o_down, controls_handler.p_down) = self._control_states[action_index]
     
     def get_action_name(self, action_index):
         """
@@ -153,13 +173,7 @@ class ActionMapper:
         Returns:
             Action index, or None if combination not in action space
         """
-        target = {'q': q, 'w': w, 'o': o, 'p': p}
-        
-        for i, keys in enumerate(self.action_to_keys):
-            if keys == target:
-                return i
-        
-        return None
+        return self._mask_to_action.get(self._keys_to_mask(q, w, o, p))
     
     def print_action_space(self):
         """Print all actions in the action space (for debugging)."""
@@ -12,6 +12,25 @@ All motor speeds and hip limits match doc/reference/QWOP_FUNCTIONS_EXACT.md line
 from .data import CONTROL_Q, CONTROL_W, CONTROL_O, CONTROL_P
 
 
+# Q/W axis: motor speeds per (q_down, w_down). Q wins when both are held,
+# matching the original if/else if/else; neither stops hips and shoulders.
+QW_MOTOR_SPEEDS = {
+    (True, False): CONTROL_Q['motor_speeds'],
+    (True, True): CONTROL_Q['motor_speeds'],
+    (False, True): CONTROL_W['motor_speeds'],
+    (False, False): dict.fromkeys(('rightHip', 'leftHip', 'rightShoulder', 'leftShoulder'), 0),
+}
+
+# O/P axis: (motor speeds, hip limits) per (o_down, p_down). O wins when both
+# are held; neither stops the knees and leaves hip limits as they are.
+OP_CONTROLS = {
+    (True, False): (CONTROL_O['motor_speeds'], CONTROL_O['hip_limits']),
+    (True, True): (CONTROL_O['motor_speeds'], CONTROL_O['hip_limits']),
+    (False, True): (CONTROL_P['motor_speeds'], CONTROL_P['hip_limits']),
+    (False, False): (dict.fromkeys(('rightKnee', 'leftKnee'), 0), {}),
+}
+
+
 class ControlsHandler:
     """
     Manages QWOP control input and applies motor commands to physics joints.
@@ -34,6 +53,10 @@ class ControlsHandler:
         """
         self.physics = physics_world
         
+        # Control tables bound to joint handles, resolved lazily (see _get_control_plans)
+        self._control_plans = None
+        self._plan_anchor = None
+        
         # Key state tracking
         self.q_down = False
         self.w_down = False
@@ -116,68 +139,60 @@ class ControlsHandler:
         - O: knees ±2.5, hip limits adjust
         - P: knees opposite, different hip limits
         - Neither: knee motors = 0
-        """
-        # Q/W AXIS: Thigh and shoulder control (mutually exclusive)
-        if self.q_down:
-            # Q Key: Right thigh forward, left thigh back
-            self._apply_motor_speeds(CONTROL_Q['motor_speeds'])
-        elif self.w_down:
-            # W Key: Left thigh forward, right thigh back
-            self._apply_motor_speeds(CONTROL_W['motor_speeds'])
-        else:
-            # No Q/W: Stop hip and shoulder motors
-            self._stop_motors(['rightHip', 'leftHip', 'rightShoulder', 'leftShoulder'])
-        
-        # O/P AXIS: Knee control + dynamic hip limits (mutually exclusive)
-        if self.o_down:
-            # O Key: Right calf forward, left calf back
-            self._apply_motor_speeds(CONTROL_O['motor_speeds'])
-            self._apply_hip_limits(CONTROL_O['hip_limits'])
-        elif self.p_down:
-            # P Key: Left calf forward, right calf back
-            self._apply_motor_speeds(CONTROL_P['motor_speeds'])
-            self._apply_hip_limits(CONTROL_P['hip_limits'])
-        else:
-            # No O/P: Stop knee motors
-            self._stop_motors(['rightKnee', 'leftKnee'])
-    
-    def _apply_motor_speeds(self, motor_speeds):
-        """
-        Apply motor speeds to joints.
         
-        Args:
-            motor_speeds: Dict of joint_name -> speed
-        """
-        for joint_name, speed in motor_speeds.items():
-            joint = self.physics.get_joint(joint_name)
-            if joint is not None:
-                joint.motorSpeed = speed
-    
-    def _stop_motors(self, joint_names):
+        Both axes are table lookups on the key states (see QW_MOTOR_SPEEDS and
+        OP_CONTROLS), pre-bound to joint handles by _get_control_plans.
         """
-        Set motor speeds to 0 for specified joints.
+        qw_plan, op_plan = self._get_control_plans()
         
-        Args:
-            joint_names: List of joint names to stop
-        """
-        for joint_name in joint_names:
-            joint = self.physics.get_joint(joint_name)
-            if joint is not None:
-                joint.motorSpeed = 0
+        # Q/W AXIS: Thigh and shoulder control
+        for joint, speed in qw_plan[self.q_down, self.w_down]:
+            joint.motorSpeed = speed
+        
+        # O/P AXIS: Knee control + dynamic hip limits
+        motor_speeds, hip_limits = op_plan[self.o_down, self.p_down]
+        for joint, speed in motor_speeds:
+            joint.motorSpeed = speed
+        for joint, lower, upper in hip_limits:
+            # PyBox2D revolute joints support direct limit setting
+            joint.lowerLimit = lower
+            joint.upperLimit = upper
     
-    def _apply_hip_limits(self, hip_limits):
+    def _get_control_plans(self):
         """
-        Apply angle limits to hip joints.
+        Get QW_MOTOR_SPEEDS and OP_CONTROLS bound to this world's joint handles.
         
-        Args:
-            hip_limits: Dict of joint_name -> (lower, upper) tuple
-        """
-        for joint_name, (lower, upper) in hip_limits.items():
-            joint = self.physics.get_joint(joint_name)
-            if joint is not None:
-                # PyBox2D revolute joints support direct limit setting
-                joint.lowerLimit = lower
-                joint.upperLimit = upper
+        Resolved once and reused across frames. PhysicsWorld.reset() recreates all
+        player joints together, so checking one handle is enough to detect stale
+        plans. Joints missing from the world are left out (elbow motors are no-ops).
+        
+        Returns:
+            (qw_plan, op_plan) where qw_plan maps (q_down, w_down) to a list of
+            (joint, speed) and op_plan maps (o_down, p_down) to a pair of lists
+            ((joint, speed), ...) and ((joint, lower, upper), ...)
+        """
+        joints = self.physics.joints
+        anchor = joints.get('rightHip')
+        if anchor is not None and anchor is self._plan_anchor:
+            return self._control_plans
+
+        def bind_speeds(motor_speeds):
+            return [(joints[name], speed) for name, speed in motor_speeds.items()
+                    if name in joints]
+        
+        qw_plan = {keys: bind_speeds(motor_speeds)
+                   for keys, motor_speeds in QW_MOTOR_SPEEDS.items()}
+        op_plan = {
+            keys: (bind_speeds(motor_speeds),
+                   [(joints[name], lower, upper) for name, (lower, upper) in hip_limits.items()
+                    if name in joints])
+            for keys, (motor_speeds, hip_limits) in OP_CONTROLS.items()
+        }
+        
+        plans = (qw_plan, op_plan)
+        self._control_plans = plans
+        self._plan_anchor = anchor
+        return plans
     
     def reset(self):
         """
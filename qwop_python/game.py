@@ -8,6 +8,7 @@ This is the "brain" of the game that owns the main update loop.
 """
 
 import math
+from collections import deque
 
 from .physics import PhysicsWorld
 from .collision import GameState, QWOPContactListener
@@ -61,6 +62,11 @@ class QWOPGame:
         self.contact_listener = QWOPContactListener(self.game_state, verbose=verbose)
         self.controls = ControlsHandler(self.physics)
         
+        # Body handles read every step, bound by _bind_bodies() once the
+        # physics world has (re)created the player
+        self._head = None
+        self._torso = None
+        
         # Game state flags
         self.pause = False
         self.first_click = False  # Set to True when game starts
@@ -70,7 +76,9 @@ class QWOPGame:
         self.score_time = 0.0  # Time elapsed in seconds
         
         # Speed tracking (for future audio implementation)
-        self.speed_array = []
+        # Bounded deque + running sum keeps the rolling average O(1) per step
+        self.speed_array = deque(maxlen=SPEED_ARRAY_MAX)
+        self._speed_sum = 0.0
         self.average_speed = 0.0
         
         # Camera state
@@ -78,6 +86,11 @@ class QWOPGame:
         self.camera_y = INITIAL_CAMERA_Y  # -200 pixels
         self.camera_offset = CAMERA_HORIZONTAL_OFFSET  # -14
         
+        # Camera tile and segment list the ground was last positioned for
+        # (see _reposition_ground_segments)
+        self._ground_tile = None
+        self._ground_segments = None
+        
         # RNG seed (for RL compatibility)
         self.seed = seed
         if seed is not None:
@@ -101,6 +114,7 @@ class QWOPGame:
         
         # Initialize physics (creates world, ground, bodies, joints)
         self.physics.initialize()
+        self._bind_bodies()
         
         # Wire up collision detection
         self.physics.set_contact_listener(self.contact_listener)
@@ -147,29 +161,33 @@ class QWOPGame:
         Args:
             dt: Delta time in seconds (typically 1/60 = 0.0167s for 60 FPS)
         """
+        game_state = self.game_state
+        
         # Step 1: Score time update
-        if not self.pause and not self.game_state.game_ended:
+        if not self.pause and not game_state.game_ended:
             self.score_time += dt
         
         # Step 3: Floor repositioning (infinite scrolling)
         self._reposition_ground_segments()
         
-        # Step 4: Head stabilization torque (critical for balance)
-        if not self.game_state.fallen:
-            head = self.physics.get_body('head')
-            if head is not None:
+        # Steps 4-5 share one head lookup
+        head = self._head
+        if head is not None:
+            # Step 4: Head stabilization torque (critical for balance)
+            if not game_state.fallen:
                 torque = HEAD_TORQUE_FACTOR * (head.angle + HEAD_TORQUE_OFFSET)
                 head.ApplyTorque(torque, True)
-        
-        # Step 5: Speed tracking (rolling average for future audio)
-        # Skip in headless mode for performance
-        if not self.headless:
-            head = self.physics.get_body('head')
-            if head is not None:
-                self.speed_array.append(head.linearVelocity[0])
-                if len(self.speed_array) > SPEED_ARRAY_MAX:
-                    self.speed_array.pop(0)
-                self.average_speed = sum(self.speed_array) / len(self.speed_array) if self.speed_array else 0.0
+            
+            # Step 5: Speed tracking (rolling average for future audio)
+            # Skip in headless mode for performance
+            if not self.headless:
+                speed = head.linearVelocity.x
+                if len(self.speed_array) == SPEED_ARRAY_MAX:
+                    # Oldest sample is evicted by the append below
+                    self._speed_sum -= self.speed_array[0]
+                self.speed_array.append(speed)
+                self._speed_sum += speed
+                self.average_speed = self._speed_sum / len(self.speed_array)
         
         # Step 6: Control input processing
         self.controls.apply()
@@ -178,54 +196,81 @@ class QWOPGame:
         if self.first_click and not self.pause:
             self.physics.step()
         
-        # Step 9: Camera follow logic
-        # Skip in headless mode for performance
-        if not self.headless:
-            self._update_camera()
-        
-        # Step 10: Score calculation (freeze when game ended to prevent shifting)
-        if not self.game_state.jump_landed and not self.game_state.game_ended:
-            torso = self.physics.get_body('torso')
-            if torso is not None:
-                self.game_state.score = round(torso.worldCenter[0]) / 10
+        # Steps 9-10 share one read of the post-step torso center
+        torso = self._torso
+        if torso is not None:
+            world_center = torso.worldCenter
+            
+            # Step 9: Camera follow logic
+            # Skip in headless mode for performance
+            if not self.headless:
+                self._update_camera(world_center)
+            
+            # Step 10: Score calculation (freeze when game ended to prevent shifting)
+            if not game_state.jump_landed and not game_state.game_ended:
+                game_state.score = round(world_center.x) / 10
         
         # Step 11: Game end check
-        if self.game_state.jump_landed and not self.game_state.game_ended:
+        if game_state.jump_landed and not game_state.game_ended:
             self.pause = True
             self.end_game()
-        elif not self.game_state.jump_landed and not self.game_state.game_ended and self.game_state.fallen:
+        elif not game_state.jump_landed and not game_state.game_ended and game_state.fallen:
             self.end_game()
     
+    def _bind_bodies(self):
+        """
+        Cache the player body handles used every step.
+        
+        Must be called after anything that (re)creates the player bodies:
+        PhysicsWorld.initialize() and PhysicsWorld.reset().
+        """
+        self._head = self.physics.get_body('head')
+        self._torso = self.physics.get_body('torso')
+    
     def _reposition_ground_segments(self):
         """
         Reposition ground segments for infinite scrolling.
         
         Each segment moves to stay ahead of the camera, creating the illusion
         of an infinite track. Uses the exact formula from the original QWOP.
+        
+        Target positions depend only on the camera's screen-width tile, and the
+        segments are static bodies, so the loop is skipped until that tile changes.
         """
-        for i, ground_body in enumerate(self.physics.ground_segments):
-            new_x = (math.floor(self.camera_x / SCREEN_WIDTH) + i) * SCREEN_WIDTH / WORLD_SCALE
+        tile = math.floor(self.camera_x / SCREEN_WIDTH)
+        segments = self.physics.ground_segments
+        if tile == self._ground_tile and segments is self._ground_segments:
+            return
+        self._ground_tile = tile
+        self._ground_segments = segments
+        
+        for i, ground_body in enumerate(segments):
+            new_x = (tile + i) * SCREEN_WIDTH / WORLD_SCALE
             
             # Only update if position changed (avoids unnecessary updates)
             if abs(new_x - ground_body.position[0]) > 0.001:
                 ground_body.position = (new_x, ground_body.position[1])
     
-    def _update_camera(self):
+    def _update_camera(self, world_center=None):
         """
         Update camera position to follow the player.
         
         Camera behavior from QWOP_FUNCTIONS_EXACT.md lines 152-175:
         - Horizontal: Follows torso x position (when not fallen)
         - Vertical: Follows torso y when jumping high (y < -5)
+        
+        Args:
+            world_center: Torso worldCenter already read this step (read from the
+                torso when omitted)
         """
         if not self.first_click:
             return
         
-        torso = self.physics.get_body('torso')
-        if torso is None:
-            return
-        
-        world_center = torso.worldCenter
+        if world_center is None:
+            torso = self._torso
+            if torso is None:
+                return
+            world_center = torso.worldCenter
         
         # Vertical camera follow (when jumping high)
         if world_center[1] < CAMERA_VERTICAL_THRESHOLD:  # y < -5
@@ -308,6 +353,7 @@ class QWOPGame:
         
         # Reset physics (destroys and recreates player)
         self.physics.reset()
+        self._bind_bodies()
         
         # Reset game state (creates new instance)
         old_high_score = self.game_state.high_score
@@ -326,7 +372,8 @@ class QWOPGame:
         self.score_time = 0.0
         
         # Reset speed tracking
-        self.speed_array = []
+        self.speed_array.clear()
+        self._speed_sum = 0.0
         self.average_speed = 0.0
         
         # Reset camera (matches JS line 849: set_x(-10 * l.worldScale))
@@ -12,6 +12,97 @@ Observation structure:
 
 import numpy as np
 
+# Normalization ranges (min, max) per body-part value, from QWOPGYM:
+# pos_x, pos_y, angle, vel_x, vel_y
+NORM_RANGES = (
+    (-10, 1050),
+    (-10, 10),
+    (-6, 6),
+    (-20, 60),
+    (-25, 60),
+)
+
+
+def _build_norm_vectors(ranges, num_parts=12):
+    """
+    Build 60-wide float32 scale/bias vectors so that norm = raw * scale + bias,
+    which equals (raw - center) / maxdev for each value's range.
+    """
+    scale = []
+    bias = []
+    for limit_min, limit_max in ranges:
+        center = (limit_min + limit_max) / 2.0
+        maxdev = limit_max - center
+        scale.append(1.0 / maxdev)
+        bias.append(-center / maxdev)
+    scale = np.tile(np.asarray(scale, dtype=np.float32), num_parts)
+    bias = np.tile(np.asarray(bias, dtype=np.float32), num_parts)
+    scale.flags.writeable = False
+    bias.flags.writeable = False
+    return scale, bias
+
+
+NORM_SCALE, NORM_BIAS = _build_norm_vectors(NORM_RANGES)
+
+
+def normalize(raw_obs, out=None):
+    """
+    Stateless min-max normalization of one or many raw observations.
+
+    Pure function of its input: works on a single (60,) observation or a batch
+    of shape (..., 60), so rollouts from several environments can be normalized
+    in one call.
+
+    Args:
+        raw_obs: Raw observation array with last dimension 60
+        out: Optional float32 array of the same shape to write into
+
+    Returns:
+        float32 array clamped to [-1, 1]
+    """
+    if out is None:
+        out = np.empty(np.shape(raw_obs), dtype=np.float32)
+    np.multiply(raw_obs, NORM_SCALE, out=out)
+    np.add(out, NORM_BIAS, out=out)
+    # Clamp to [-1, 1] (matches QWOPGYM behavior). fmin/fmax rather than clip so
+    # that a NaN from a physics blow-up is also pinned inside the Box bounds.
+    np.fmin(out, 1.0, out=out)
+    np.fmax(out, -1.0, out=out)
+    return out
+
+
+def quantize_int8(obs, bound=1.0, out=None):
+    """
+    Quantize a normalized observation in [-bound, bound] to int8 in [-127, 127].
+
+    Backs QWOPEnv's opt-in obs_dtype="int8", for external or vectorized consumers
+    that want compact observations; it only adds quantization error otherwise.
+    Undo with dequantize_int8.
+
+    Args:
+        obs: Normalized float observation (already clamped to [-bound, bound])
+        bound: Observation bound that maps to +/-127 (default: 1.0)
+        out: Optional int8 array of the same shape to write into
+
+    Returns:
+        int8 array
+    """
+    scaled = np.multiply(obs, 127.0 / bound, dtype=np.float32)
+    np.rint(scaled, out=scaled)
+    if out is None:
+        out = np.empty(scaled.shape, dtype=np.int8)
+    np.copyto(out, scaled, casting='unsafe')
+    return out
+
+
+def dequantize_int8(obs, bound=1.0):
+    """Convert an int8 observation from quantize_int8 back to float32 in [-bound, bound]."""
+    return np.multiply(obs, bound / 127.0, dtype=np.float32)
+
+
+# Bound applied to running-mean/std normalized observations (in standard deviations)
+RMS_CLIP = 5.0
+
 
 class Normalizer:
     """
@@ -73,6 +164,104 @@ class Normalizer:
         return norm * self.maxdev + self.center
 
 
+class RunningMeanStd:
+    """
+    Running mean/variance observation normalizer (alternative to the fixed ranges).
+
+    Statistics are updated per sample with Welford's algorithm and the observation
+    becomes (raw - mean) / std, clamped to [-clip, clip]. All math runs on
+    preallocated arrays; 1/std is recomputed lazily after an update.
+    """
+
+    def __init__(self, size=60, epsilon=1e-8, clip=RMS_CLIP):
+        """
+        Initialize an empty running normalizer.
+
+        Args:
+            size: Number of observation values (default: 60)
+            epsilon: Added to the variance before the square root
+            clip: Output bound in standard deviations (default: RMS_CLIP)
+        """
+        self.size = size
+        self.epsilon = epsilon
+        self.clip = float(clip)
+        self.count = 0
+        # float64 so that mean/M2 do not drift over millions of updates
+        self.mean = np.zeros(size, dtype=np.float64)
+        self._m2 = np.zeros(size, dtype=np.float64)
+        # Scratch buffers so update/_refresh do not allocate
+        self._delta = np.empty(size, dtype=np.float64)
+        self._scratch = np.empty(size, dtype=np.float64)
+        self._inv_std = np.ones(size, dtype=np.float32)
+        self._mean32 = np.zeros(size, dtype=np.float32)
+        self._stale = False
+
+    @property
+    def var(self):
+        """Population variance of the values seen so far."""
+        if self.count == 0:
+            return np.ones(self.size, dtype=np.float64)
+        return self._m2 / self.count
+
+    def update(self, raw_obs):
+        """
+        Add one raw observation to the running statistics (Welford).
+
+        Samples with a non-finite value (physics blow-up) are skipped; a single
+        NaN/inf would otherwise stay in mean/M2 for good.
+
+        Args:
+            raw_obs: Raw observation array of length size
+        """
+        if not np.isfinite(raw_obs).all():
+            return
+        self.count += 1
+        delta = self._delta
+        scratch = self._scratch
+        np.subtract(raw_obs, self.mean, out=delta)
+        np.divide(delta, self.count, out=scratch)
+        self.mean += scratch
+        # M2 += delta * (x - new_mean)
+        np.subtract(raw_obs, self.mean, out=scratch)
+        np.multiply(delta, scratch, out=delta)
+        self._m2 += delta
+        self._stale = True
+
+    def _refresh(self):
+        """Recompute float32 mean and 1/std after updates."""
+        self._mean32[:] = self.mean
+        std = self._scratch
+        np.divide(self._m2, self.count, out=std)
+        std += self.epsilon
+        np.sqrt(std, out=std)
+        np.divide(1.0, std, out=self._inv_std, casting='unsafe')
+        self._stale = False
+
+    def normalize(self, raw_obs, out=None, update=True):
+        """
+        Normalize raw observation with the running statistics.
+
+        Args:
+            raw_obs: Raw observation array of length size
+            out: Optional float32 array to write into (allocated if None)
+            update: If True, add raw_obs to the statistics first
+
+        Returns:
+            float32 observation clamped to [-clip, clip]
+        """
+        if update:
+            self.update(raw_obs)
+        if self._stale:
+            self._refresh()
+        if out is None:
+            out = np.empty(self.size, dtype=np.float32)
+        np.subtract(raw_obs, self._mean32, out=out)
+        np.multiply(out, self._inv_std, out=out)
+        np.fmin(out, self.clip, out=out)
+        np.fmax(out, -self.clip, out=out)
+        return out
+
+
 class ObservationExtractor:
     """
     Extracts RL observations from QWOP physics world.
@@ -96,78 +285,95 @@ class ObservationExtractor:
     
     def __init__(self):
         """
-        Initialize observation extractor with normalizers.
+        Initialize observation extractor.
         
-        Normalization ranges from QWOPGYM:
+        Normalization ranges from QWOPGYM (NORM_RANGES):
         - pos_x: [-10, 1050]
         - pos_y: [-10, 10]
         - angle: [-6, 6] radians
         - vel_x: [-20, 60]
         - vel_y: [-25, 60]
         """
-        self.pos_x = Normalizer(-10, 1050)
-        self.pos_y = Normalizer(-10, 10)
-        self.angle = Normalizer(-6, 6)
-        self.vel_x = Normalizer(-20, 60)
-        self.vel_y = Normalizer(-25, 60)
+        # Extremes seen per value type (pos_x, pos_y, angle, vel_x, vel_y), for debugging
+        self._min_seen = np.zeros(5, dtype=np.float32)
+        self._max_seen = np.zeros(5, dtype=np.float32)
+
+        # Physics bodies in BODY_PART_ORDER (see _get_bodies)
+        self._bodies = None
     
-    def extract_raw(self, physics_world):
+    def _get_bodies(self, physics_world):
         """
-        Extract raw (unnormalized) observation from physics world.
+        Get the physics world's body parts in BODY_PART_ORDER.
+        
+        Resolved once and reused across steps. PhysicsWorld.reset() recreates all
+        player bodies together, so checking the first entry is enough to detect a
+        stale list (after a reset or when extracting from a different world).
         
         Args:
             physics_world: PhysicsWorld instance
             
         Returns:
-            numpy array of 60 floats (unnormalized)
+            List of 12 b2Body
+            
+        Raises:
+            ValueError: If a body part is missing from the physics world
         """
-        obs = np.zeros(60, dtype=np.float32)
+        bodies = self._bodies
+        if bodies and physics_world.bodies.get(self.BODY_PART_ORDER[0]) is bodies[0]:
+            return bodies
         
-        for i, body_name in enumerate(self.BODY_PART_ORDER):
+        bodies = []
+        for body_name in self.BODY_PART_ORDER:
             body = physics_world.get_body(body_name)
             if body is None:
                 raise ValueError(f"Body part '{body_name}' not found in physics world")
+            bodies.append(body)
+        self._bodies = bodies
+        return bodies
+    
+    def extract_raw(self, physics_world):
+        """
+        Extract raw (unnormalized) observation from physics world.
+        
+        Args:
+            physics_world: PhysicsWorld instance
             
-            # Extract position, angle, velocity
+        Returns:
+            numpy array of 60 floats (unnormalized), newly allocated on every call,
+            so callers may keep it without copying
+        """
+        # Gather all 60 values into one flat list and convert once; per-element
+        # stores into a numpy array cost more than the Box2D reads themselves
+        state = []
+        for body in self._get_bodies(physics_world):
+            # Extract position, angle, velocity (5 values per body part)
             # CRITICAL: Use worldCenter (not position) to match JavaScript's getPosition()
             pos = body.worldCenter
-            angle = body.angle
             vel = body.linearVelocity
-            
-            # Store in observation array (5 values per body part)
-            idx = i * 5
-            obs[idx] = pos[0]      # x position
-            obs[idx + 1] = pos[1]  # y position
-            obs[idx + 2] = angle   # angle (radians)
-            obs[idx + 3] = vel[0]  # x velocity
-            obs[idx + 4] = vel[1]  # y velocity
+            state += (pos.x, pos.y, body.angle, vel.x, vel.y)
         
-        return obs
+        return np.array(state, dtype=np.float32)
     
-    def normalize_observation(self, raw_obs):
+    def normalize_observation(self, raw_obs, out=None):
         """
         Normalize raw observation to [-1, 1] range.
+
+        All 60 values are normalized at once as raw * NORM_SCALE + NORM_BIAS.
         
         Args:
             raw_obs: Raw 60-float observation array
+            out: Optional float32 array of 60 to write into (allocated if None)
             
         Returns:
             Normalized observation clamped to [-1, 1]
         """
-        norm_obs = np.zeros(60, dtype=np.float32)
-        
-        # Normalize each body part's 5 values
-        for i in range(0, 60, 5):
-            norm_obs[i] = self.pos_x.normalize(raw_obs[i])
-            norm_obs[i + 1] = self.pos_y.normalize(raw_obs[i + 1])
-            norm_obs[i + 2] = self.angle.normalize(raw_obs[i + 2])
-            norm_obs[i + 3] = self.vel_x.normalize(raw_obs[i + 3])
-            norm_obs[i + 4] = self.vel_y.normalize(raw_obs[i + 4])
-        
-        # Clamp to [-1, 1] (matches QWOPGYM behavior)
-        np.clip(norm_obs, -1, 1, out=norm_obs)
-        
-        return norm_obs
+        # Track extremes for debugging (columns are the 5 value types). fmin/fmax
+        # skip NaN, so a physics blow-up does not wipe the stats
+        parts = raw_obs.reshape(12, 5)
+        np.fmin(self._min_seen, np.fmin.reduce(parts, axis=0), out=self._min_seen)
+        np.fmax(self._max_seen, np.fmax.reduce(parts, axis=0), out=self._max_seen)
+
+        return normalize(raw_obs, out=out)
     
     def extract(self, physics_world):
         """
@@ -189,15 +395,9 @@ class ObservationExtractor:
         Returns:
             dict with min/max seen for each normalizer
         """
+        names = ('pos_x', 'pos_y', 'angle', 'vel_x', 'vel_y')
         return {
-            'pos_x': {'min': self.pos_x.min_seen, 'max': self.pos_x.max_seen, 
-                      'range': [self.pos_x.limit_min, self.pos_x.limit_max]},
-            'pos_y': {'min': self.pos_y.min_seen, 'max': self.pos_y.max_seen,
-                      'range': [self.pos_y.limit_min, self.pos_y.limit_max]},
-            'angle': {'min': self.angle.min_seen, 'max': self.angle.max_seen,
-                      'range': [self.angle.limit_min, self.angle.limit_max]},
-            'vel_x': {'min': self.vel_x.min_seen, 'max': self.vel_x.max_seen,
-                      'range': [self.vel_x.limit_min, self.vel_x.limit_max]},
-            'vel_y': {'min': self.vel_y.min_seen, 'max': self.vel_y.max_seen,
-                      'range': [self.vel_y.limit_min, self.vel_y.limit_max]},
+            name: {'min': float(self._min_seen[i]), 'max': float(self._max_seen[i]),
+                   'range': [float(NORM_RANGES[i][0]), float(NORM_RANGES[i][1])]}
+            for i, name in enumerate(names)
         }
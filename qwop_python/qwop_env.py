@@ -15,11 +15,18 @@ import gymnasium as gymnasium
 from gymnasium import spaces
 
 from .game import QWOPGame
-from .observations import ObservationExtractor
+from .observations import ObservationExtractor, RunningMeanStd, quantize_int8
 from .actions import ActionMapper
 from .data import PHYSICS_TIMESTEP, SCREEN_WIDTH, SCREEN_HEIGHT, OBS_PANEL_WIDTH
 
 
+# Keys QWOPEnv puts in the info dict (used by _build_info to prune added keys)
+_ENV_INFO_KEYS = (
+    'time', 'distance', 'avgspeed', 'is_success', 'fallen', 'jumped',
+    'jump_landed', 'episode_steps', 'total_reward', 'episode_start_time',
+)
+
+
 class QWOPEnv(gymnasium.Env):
     """
     QWOP Gymnasium environment for RL training.
@@ -38,6 +45,17 @@ class QWOPEnv(gymnasium.Env):
         speed_rew_mult: Multiplier for velocity in reward (default: 0.2)
         seed: Random seed for deterministic physics (default: None)
         render_mode: None (headless) or "human" (Pygame window)
+        obs_norm: "minmax" (fixed QWOPGYM ranges, obs in [-1, 1]) or "rms"
+                  (running mean/std, obs in [-RMS_CLIP, RMS_CLIP]) (default: "minmax").
+                  The "rms" statistics start empty in every env and are not saved
+                  with checkpoints, so it is not exposed through the YAML configs
+        obs_dtype: "float32" or "int8" (normalized obs quantized to [-127, 127],
+                   dequantize with observations.dequantize_int8) (default: "float32")
+        copy_info: If False, step returns the same info dict each time, updated in
+                   place (keys added downstream are dropped by the next step); reset
+                   always returns a new dict, so a VecEnv's terminal_observation and
+                   Monitor's episode stats survive its auto-reset. Only safe when
+                   callers do not keep infos across steps (default: True)
     """
 
     metadata = {"render_modes": ["human"]}
@@ -54,6 +72,9 @@ class QWOPEnv(gymnasium.Env):
         seed=None,
         render_mode=None,
         show_observation_panel=False,
+        obs_norm="minmax",
+        obs_dtype="float32",
+        copy_info=True,
     ):
         super().__init__()
 
@@ -66,20 +87,42 @@ class QWOPEnv(gymnasium.Env):
         self.obs_extractor = ObservationExtractor()
         self.action_mapper = ActionMapper(reduced_action_set=reduced_action_set)
 
+        if obs_norm not in ("minmax", "rms"):
+            raise ValueError(f"Unsupported obs_norm: {obs_norm!r} (expected 'minmax' or 'rms')")
+        self.obs_norm = obs_norm
+        self.obs_rms = RunningMeanStd(60) if obs_norm == "rms" else None
+        if obs_dtype not in ("float32", "int8"):
+            raise ValueError(f"Unsupported obs_dtype: {obs_dtype!r} (expected 'float32' or 'int8')")
+        self.obs_dtype = obs_dtype
+
+        # Reward terms are kept as plain Python floats (no NumPy scalar promotion per step)
         self.frames_per_step = frames_per_step
-        self.failure_cost = failure_cost
-        self.success_reward = success_reward
-        self.time_cost_mult = time_cost_mult
-        self.distance_rew_mult = distance_rew_mult
-        self.speed_rew_mult = speed_rew_mult
+        self.failure_cost = float(failure_cost)
+        self.success_reward = float(success_reward)
+        self.time_cost_mult = float(time_cost_mult)
+        self.distance_rew_mult = float(distance_rew_mult)
+        self.speed_rew_mult = float(speed_rew_mult)
+
+        # Protocol-scale dt and per-step time cost are constant (see _calc_reward)
+        self._dt_protocol = max(self.frames_per_step * (1 / 30) / 10, 1e-8)
+        self._time_cost = self.time_cost_mult * self._dt_protocol / self.frames_per_step
 
         n_actions = self.action_mapper.num_actions
-        self.observation_space = spaces.Box(
-            shape=(60,),
-            low=-1.0,
-            high=1.0,
-            dtype=np.float32
-        )
+        self._obs_bound = self.obs_rms.clip if self.obs_rms is not None else 1.0
+        if obs_dtype == "int8":
+            self.observation_space = spaces.Box(
+                shape=(60,),
+                low=-127,
+                high=127,
+                dtype=np.int8
+            )
+        else:
+            self.observation_space = spaces.Box(
+                shape=(60,),
+                low=-self._obs_bound,
+                high=self._obs_bound,
+                dtype=np.float32
+            )
         self.action_space = spaces.Discrete(n_actions)
 
         self._last_distance = 0.0
@@ -95,6 +138,7 @@ class QWOPEnv(gymnasium.Env):
         self._last_raw_obs = None
         self._last_info = None
         self._last_action = 0
+        self._info = None if copy_info else {}
         self._screen = None
         self._game_surface = None
         self._renderer = None
@@ -138,8 +182,8 @@ class QWOPEnv(gymnasium.Env):
         self._distance_buffer = []
 
         raw_obs = self.obs_extractor.extract_raw(self.game.physics)
-        obs = self.obs_extractor.normalize_observation(raw_obs)
-        info = self._build_info()
+        obs = self._normalize(raw_obs)
+        info = self._build_info(fresh=True)
         self._last_obs = obs
         self._last_raw_obs = raw_obs
         self._last_info = info
@@ -164,14 +208,16 @@ class QWOPEnv(gymnasium.Env):
         # Apply action
         self.action_mapper.apply_action(action, self.game.controls)
         
-        # Run physics for frames_per_step ticks
+        # Run physics for frames_per_step ticks (game_ended only ever flips on)
+        game = self.game
         for _ in range(self.frames_per_step):
-            if not self.game.game_state.game_ended:
-                self.game.update(dt=PHYSICS_TIMESTEP)
+            if game.game_state.game_ended:
+                break
+            game.update(dt=PHYSICS_TIMESTEP)
         
         # Get observation (raw for display, normalized for RL)
         raw_obs = self.obs_extractor.extract_raw(self.game.physics)
-        obs = self.obs_extractor.normalize_observation(raw_obs)
+        obs = self._normalize(raw_obs)
 
         # Update distance buffer before reward (so _calc_reward can use smoothed velocity)
         dist = self.game.game_state.score
@@ -194,6 +240,16 @@ class QWOPEnv(gymnasium.Env):
 
         return obs, reward, terminated, False, info
     
+    def _normalize(self, raw_obs):
+        """Normalize a raw observation according to obs_norm (and quantize for obs_dtype="int8")."""
+        if self.obs_rms is not None:
+            obs = self.obs_rms.normalize(raw_obs)
+        else:
+            obs = self.obs_extractor.normalize_observation(raw_obs)
+        if self.obs_dtype == "int8":
+            return quantize_int8(obs, self._obs_bound)
+        return obs
+
     def _calc_reward(self):
         """
         Calculate reward based on distance, velocity, and time cost.
@@ -221,8 +277,7 @@ class QWOPEnv(gymnasium.Env):
         ds = dist - self._last_distance
 
         # Protocol-scale dt: matches qwop-wr (TIMESTEP_SIZE=1/30, time=scoreTime/10)
-        dt_protocol = self.frames_per_step * (1 / 30) / 10
-        dt_protocol = max(dt_protocol, 1e-8)
+        dt_protocol = self._dt_protocol
 
         # Use smoothed velocity over buffer when available (prevents oscillation exploitation)
         buf = self._distance_buffer
@@ -240,7 +295,7 @@ class QWOPEnv(gymnasium.Env):
         reward = (
             self.distance_rew_mult * ds
             + velocity * self.speed_rew_mult
-            - (self.time_cost_mult * dt_protocol / self.frames_per_step)
+            - self._time_cost
         )
         
         # Terminal bonuses/penalties
@@ -256,9 +311,12 @@ class QWOPEnv(gymnasium.Env):
 
         return float(reward)
     
-    def _build_info(self):
+    def _build_info(self, fresh=False):
         """
-        Build info dictionary with metadata.
+        Build info dictionary with metadata (a new dict, or the reused one if copy_info=False).
+        
+        Args:
+            fresh: Return a new dict even if copy_info=False
         
         Returns:
             Dictionary with game state information
@@ -279,18 +337,25 @@ class QWOPEnv(gymnasium.Env):
             and not self.game.game_state.fallen
         ) else 0.0
 
-        return {
-            'time': time_val,
-            'distance': distance,
-            'avgspeed': avgspeed,
-            'is_success': is_success,
-            'fallen': self.game.game_state.fallen,
-            'jumped': self.game.game_state.jumped,
-            'jump_landed': self.game.game_state.jump_landed,
-            'episode_steps': self._episode_steps,
-            'total_reward': self._total_reward,
-            'episode_start_time': self._episode_start_time,
-        }
+        info = None if fresh else self._info
+        if info is None:
+            info = {}
+        elif len(info) > len(_ENV_INFO_KEYS):
+            # Reused dict: drop keys added downstream (Monitor 'episode', 'terminal_observation', ...)
+            for key in [k for k in info if k not in _ENV_INFO_KEYS]:
+                del info[key]
+
+        info['time'] = time_val
+        info['distance'] = distance
+        info['avgspeed'] = avgspeed
+        info['is_success'] = is_success
+        info['fallen'] = self.game.game_state.fallen
+        info['jumped'] = self.game.game_state.jumped
+        info['jump_landed'] = self.game.game_state.jump_landed
+        info['episode_steps'] = self._episode_steps
+        info['total_reward'] = self._total_reward
+        info['episode_start_time'] = self._episode_start_time
+        return info
     
     def render(self):
         """Render one frame. Only works when render_mode='human'."""
@@ -305,6 +370,8 @@ class QWOPEnv(gymnasium.Env):
                 self._screen, SCREEN_WIDTH, 0,
                 self._last_raw_obs, info
             )
+        # Full-viewport redraw every frame (camera scrolls, bodies move), so flip()
+        # beats display.update(rects); no dirty rects are tracked
         pygame.display.flip()
         return None
 
@@ -8,6 +8,9 @@ Handles all rendering for the QWOP game:
 - HUD (score, time, game-over message)
 - Q/W/O/P key indicators
 
+Every frame is a full redraw of the viewport; callers present it with
+pygame.display.flip() (dirty-rect updates cannot help when the camera scrolls).
+
 This is a read-only module - it does not modify game state.
 """
 
@@ -15,6 +18,7 @@ import json
 import os
 import pygame
 import math
+import numpy as np
 
 from .data import (
     BODY_PARTS,
@@ -32,6 +36,29 @@ from .observations import ObservationExtractor
 # Track dimensions (matches JS floor segment: screenWidth x underground.height)
 TRACK_HEIGHT_PX = 64
 TRACK_TILE_WIDTH_PX = 640
+TRACK_SEGMENTS = 3
+# Screen center, used for viewport culling as |pos - center| <= center + extent
+SCREEN_HALF_SIZE = (SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
+# Lane marker size: JS startingLine (spriteSourceSize.w, 0.7 * spriteSourceSize.h)
+LANE_MARKER_SIZE = (37, 77)
+# Sand pit composite: top-left of the SandBoard in JS world pixels, and the bounding
+# box of tape, sand body, sand head and board
+SANDPIT_ORIGIN = (SAND_PIT_AT - 183, 155)
+SANDPIT_SIZE = (2177, 110)
+
+# Maximum number of rendered text surfaces kept by QWOPRenderer._render_cached
+TEXT_CACHE_SIZE = 512
+
+# Colorkey for the single-color rect surfaces (fallback body parts, hurdle); must
+# not match any body/hurdle color
+RECT_COLORKEY = (255, 0, 255)
+
+# Sprite rotation cache resolution: half-degree bins (invisible at sprite sizes)
+SPRITE_ROTATION_BINS = 720
+SPRITE_BINS_PER_RADIAN = SPRITE_ROTATION_BINS / (2 * math.pi)
+
+# Angular resolution of the pre-rotated fallback body rects (degrees per step)
+ROTATION_STEP_DEG = 2
 
 # Body part key -> display label (matches qwop-gym QWOP.html)
 BODY_PART_DISPLAY_LABELS = {
@@ -66,6 +93,54 @@ BODY_PART_TO_FRAME_INDEX = {
 }
 
 
+# Loaded assets shared by every QWOPRenderer in the process (race view, one
+# renderer per env worker). Surfaces are only ever read, never drawn on.
+_IMAGE_CACHE = {}
+_FRAMES_CACHE = {}
+
+
+def _load_image(path, alpha):
+    """
+    Load and convert an image once per process.
+
+    Args:
+        path: Image file path
+        alpha: True for convert_alpha() (per-pixel alpha), False for convert()
+
+    Returns:
+        Shared pygame.Surface - do not modify
+
+    Raises:
+        pygame.error: If the image cannot be loaded
+    """
+    key = (path, alpha)
+    surf = _IMAGE_CACHE.get(key)
+    if surf is None:
+        surf = pygame.image.load(path)
+        surf = surf.convert_alpha() if alpha else surf.convert()
+        _IMAGE_CACHE[key] = surf
+    return surf
+
+
+def _load_atlas_frames(json_path):
+    """
+    Parse a TexturePacker JSON file once per process.
+
+    Returns:
+        Shared list of frame dicts - do not modify
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    frames = _FRAMES_CACHE.get(json_path)
+    if frames is None:
+        with open(json_path, 'r') as f:
+            data = json.load(f)
+        frames = data.get('frames', [])
+        _FRAMES_CACHE[json_path] = frames
+    return frames
+
+
 class QWOPRenderer:
     """
     Pygame-based renderer for QWOP game.
@@ -98,6 +173,14 @@ class QWOPRenderer:
         self.table_font = pygame.font.SysFont('verdana', 12)  # matches qwop-gym #metrics
         self.hud_secondary_font = pygame.font.SysFont('verdana', 18, bold=False)  # Best + Timer (match mundo18)
         
+        # Rendered text surfaces keyed by (font, text, color), least recently used evicted first
+        self._text_cache = {}
+        # Fallback HUD key buttons, keyed by (key_char, is_pressed, size)
+        self._key_surfs = {}
+        # Game-over / intro overlay (static, so filled once)
+        self._black_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self._black_overlay.fill((0, 0, 0, 153))  # 0.6 * 255 ≈ 153
+        
         # Colors (no purple per user rules)
         self.colors = {
             'sky': (135, 206, 235),      # Light blue
@@ -129,6 +212,17 @@ class QWOPRenderer:
         # Lower depth = drawn first = farther back
         self.render_order = sorted(BODY_PARTS.keys(), key=lambda name: BODY_PARTS[name]['depth'])
 
+        # (surface, dest) pairs staged during render() and issued in one batch call
+        self._frame_blits = []
+        self._use_fblits = hasattr(screen, 'fblits')  # pygame-ce; plain pygame has blits()
+
+        # Resolved [(body_name, body, config, base_surf, rotations), ...] in render
+        # order (see _get_draw_list)
+        self._draw_list = None
+        self._draw_list_extents = None
+        self._draw_list_bin_counts = None
+        self._draw_list_bin_scale = None
+
         # Asset directory (qwop_python/assets/)
         self._assets_dir = os.path.join(os.path.dirname(__file__), 'assets')
 
@@ -137,18 +231,47 @@ class QWOPRenderer:
         _tex_path = os.path.join(self._assets_dir, 'underground.png')
         if os.path.exists(_tex_path):
             try:
-                self.track_texture = pygame.image.load(_tex_path).convert_alpha()
+                # Opaque tileset: convert() keeps blits on the no-alpha fast path
+                self.track_texture = _load_image(_tex_path, alpha=False)
             except pygame.error:
                 pass
         if self.track_texture is None:
-            self.track_texture = pygame.Surface((128, 64))
+            self.track_texture = pygame.Surface((128, 64), 0, self.screen)
             self.track_texture.fill(self.colors['track'])
 
         # Player sprite atlas (playercolor.png + playercolor.json)
         self._player_atlas = None
         self._player_frames = None
+        self._frame_surfaces = {}
         self._load_player_atlas()
 
+        # Single-color hurdle surfaces (filled once) and their rotations, filled on
+        # first use per angle bin (the hurdle only tips once knocked)
+        self._hurdle_base_surf = None
+        self._hurdle_top_surf = None
+        self._hurdle_base_rotations = None
+        self._hurdle_top_rotations = None
+        if HURDLES_ENABLED:
+            self._hurdle_base_surf = self._make_rect_surface(HURDLE_BASE_SIZE, self.colors['hurdle_base'])
+            self._hurdle_top_surf = self._make_rect_surface(HURDLE_TOP_SIZE, self.colors['hurdle_top'])
+            self._hurdle_base_rotations = self._new_rotation_cache(self._hurdle_base_surf)
+            self._hurdle_top_rotations = self._new_rotation_cache(self._hurdle_top_surf)
+
+        # Sprite path: scaled atlas frame per body part, and a dense rotation cache per
+        # part indexed by angle bin in [0, SPRITE_ROTATION_BINS), filled on first use
+        self._sprite_base_surfs = {}
+        self._sprite_rotations = {}
+        if self._player_atlas is not None and self._player_frames is not None:
+            self._prebuild_body_base_surfaces()
+
+        # Pre-rotated colored rects (fallback when the player atlas is missing)
+        self._body_rect_rotations = {}
+        if self._player_atlas is None or self._player_frames is None:
+            self._build_body_rect_rotations()
+
+        # Per-part draw data resolved once, so the per-frame loop does no dict lookups
+        self._render_plan = self._build_render_plan()
+
         # Background textures
         self._sprintbg_texture = None
         self._sky_texture = None
@@ -159,8 +282,23 @@ class QWOPRenderer:
         # UISprites for sand pit (SandBoard frame 16, sandpit frame 24)
         self._ui_atlas = None
         self._ui_frames = None
+        self._ui_frame_surfaces = []
         self._load_ui_atlas()
 
+        # Lane marker (Starting_Line, UISprites frame 17) scaled once to LANE_MARKER_SIZE
+        self._lane_marker_surf = None
+        if len(self._ui_frame_surfaces) > 17:
+            self._lane_marker_surf = pygame.transform.smoothscale(
+                self._ui_frame_surfaces[17], LANE_MARKER_SIZE
+            )
+
+        # Sand pit: tape, sand, head and board composited once into one surface
+        self._sandpit_composite = None
+        self._build_sandpit_composite()
+        # Last (camera_x, camera_y) and the sand pit blit for it (None: out of view)
+        self._sandpit_blit_camera = None
+        self._sandpit_blit = None
+
         print("✓ Renderer initialized")
         print(f"  Render order: {self.render_order}")
 
@@ -171,62 +309,174 @@ class QWOPRenderer:
         if not os.path.exists(atlas_path) or not os.path.exists(json_path):
             return
         try:
-            self._player_atlas = pygame.image.load(atlas_path).convert_alpha()
-            with open(json_path, 'r') as f:
-                data = json.load(f)
-            self._player_frames = data.get('frames', [])
+            self._player_atlas = _load_image(atlas_path, alpha=True)
+            self._player_frames = _load_atlas_frames(json_path)
+            # Cut each body-part frame once (subsurfaces share the atlas pixels)
+            self._frame_surfaces = {
+                frame_idx: self._atlas_subsurface(self._player_atlas, self._player_frames[frame_idx])
+                for frame_idx in BODY_PART_TO_FRAME_INDEX.values()
+                if frame_idx < len(self._player_frames)
+            }
         except (pygame.error, json.JSONDecodeError):
             self._player_atlas = None
             self._player_frames = None
+            self._frame_surfaces = {}
+
+    def _atlas_subsurface(self, atlas, frame_data):
+        """Return a subsurface view of atlas for a TexturePacker frame entry (no pixel copy)."""
+        fr = frame_data['frame']
+        return atlas.subsurface(pygame.Rect(fr['x'], fr['y'], fr['w'], fr['h']))
+
+    def _make_rect_surface(self, size, color):
+        """
+        Create an opaque surface of size (w, h) in pixels, filled with color.
+
+        No per-pixel alpha: RECT_COLORKEY is set instead, so pygame.transform.rotate
+        pads the corners with the colorkey and they stay transparent when blitted.
+        """
+        surf = pygame.Surface(size)
+        surf.fill(color)
+        surf.set_colorkey(RECT_COLORKEY, pygame.RLEACCEL)
+        return surf
+
+    def _prebuild_body_base_surfaces(self):
+        """Scale each body part's atlas frame to its physics size once (avoids per-frame smoothscale)."""
+        for body_name, frame_idx in BODY_PART_TO_FRAME_INDEX.items():
+            surf = self._frame_surfaces.get(frame_idx)
+            config = BODY_PARTS.get(body_name)
+            if surf is None or config is None:
+                continue
+            # Scale to physics dimensions (same as colored rect path). Compare in
+            # whole pixels: the float size almost never equals the int frame size
+            target_size = (
+                int(config['half_width'] * 2 * WORLD_SCALE),
+                int(config['half_height'] * 2 * WORLD_SCALE),
+            )
+            if surf.get_size() != target_size:
+                surf = pygame.transform.smoothscale(surf, target_size)
+            self._sprite_base_surfs[body_name] = surf
+            self._sprite_rotations[body_name] = self._new_rotation_cache(surf)
+
+    def _new_rotation_cache(self, surf):
+        """
+        Create a dense rotation cache for surf with SPRITE_ROTATION_BINS slots.
+
+        Slot 0 (upright, within half a bin) is the unrotated surface itself, so
+        upright poses never call pygame.transform.rotate; the rest fill on first use.
+        """
+        rotations = [None] * SPRITE_ROTATION_BINS
+        rotations[0] = surf
+        return rotations
+
+    def _build_render_plan(self):
+        """
+        Build the per-part draw data in render order.
+
+        Sprite parts carry their scaled base surface and dense rotation cache;
+        fallback parts carry None and their pre-rotated rect table. Parts with no
+        atlas frame are left out (they are not drawn).
+
+        Returns:
+            List of (body_name, config, base_surf, rotations) tuples
+        """
+        use_sprites = self._player_atlas is not None and self._player_frames is not None
+        plan = []
+        for body_name in self.render_order:
+            config = BODY_PARTS[body_name]
+            if use_sprites:
+                base_surf = self._sprite_base_surfs.get(body_name)
+                if base_surf is None:
+                    continue
+                plan.append((body_name, config, base_surf, self._sprite_rotations[body_name]))
+            else:
+                plan.append((body_name, config, None, self._body_rect_rotations[body_name]))
+        return plan
+
+    def _build_body_rect_rotations(self):
+        """Pre-rotate each fallback body rect every ROTATION_STEP_DEG degrees (avoids per-frame rotate)."""
+        for body_name in self.render_order:
+            config = BODY_PARTS[body_name]
+            width_px = config['half_width'] * 2 * WORLD_SCALE
+            height_px = config['half_height'] * 2 * WORLD_SCALE
+            surf = self._make_rect_surface(
+                (width_px, height_px), self.body_colors.get(body_name, (128, 128, 128))
+            )
+            # Upright slot is the surface itself (rotate by 0 would only copy it)
+            self._body_rect_rotations[body_name] = [surf] + [
+                pygame.transform.rotate(surf, angle)
+                for angle in range(ROTATION_STEP_DEG, 360, ROTATION_STEP_DEG)
+            ]
 
     def _load_background_textures(self):
-        """Load sprintbg, sky, sand, sandtape.
+        """Load sprintbg, sand, sandtape (all opaque, so convert() rather than convert_alpha()).
         sprintbg.jpg is 1px wide (vertical gradient); scale sideways to 640x400 to match JS."""
         try:
             sprintbg_path = os.path.join(self._assets_dir, 'sprintbg.jpg')
             if os.path.exists(sprintbg_path):
-                tex = pygame.image.load(sprintbg_path).convert()
+                tex = _load_image(sprintbg_path, alpha=False)
                 # JS uses size (640, 400), uv (0,0,640,400) - stretch 1px width across full screen
-                self._sprintbg_texture = pygame.transform.scale(tex, (SCREEN_WIDTH, SCREEN_HEIGHT))
+                self._sprintbg_texture = pygame.transform.scale(
+                    tex, (SCREEN_WIDTH, SCREEN_HEIGHT)
+                ).convert(self.screen)
         except pygame.error:
             self._sprintbg_texture = None
-        try:
-            sky_path = os.path.join(self._assets_dir, 'sky.png')
-            if os.path.exists(sky_path):
-                self._sky_texture = pygame.image.load(sky_path).convert_alpha()
-        except pygame.error:
-            pass
+        # sky.png is not loaded: it is never drawn (see _draw_background), and the
+        # sprintbg gradient above is already one pre-scaled full-screen blit
         try:
             sand_path = os.path.join(self._assets_dir, 'sand.png')
             if os.path.exists(sand_path):
-                self._sand_texture = pygame.image.load(sand_path).convert_alpha()
+                self._sand_texture = _load_image(sand_path, alpha=False)
         except pygame.error:
             pass
         try:
             sandtape_path = os.path.join(self._assets_dir, 'sandtape.png')
             if os.path.exists(sandtape_path):
-                self._sandtape_texture = pygame.image.load(sandtape_path).convert_alpha()
+                self._sandtape_texture = _load_image(sandtape_path, alpha=False)
         except pygame.error:
             pass
         self._prepare_tiled_textures()
 
     def _tile_texture(self, tex, target_w, target_h):
-        """Tile texture to fill target size (matches JS GL_REPEAT). Returns a Surface."""
+        """Tile texture to fill target size (matches JS GL_REPEAT). Returns a Surface.
+        The result has per-pixel alpha only if tex does; opaque results use the
+        target screen's pixel format so per-frame blits need no conversion."""
         tw, th = tex.get_size()
-        surf = pygame.Surface((target_w, target_h), pygame.SRCALPHA)
+        surf = self._make_layer_surface((target_w, target_h), tex.get_flags() & pygame.SRCALPHA)
         for y in range(0, target_h, th):
             for x in range(0, target_w, tw):
                 surf.blit(tex, (x, y))
         return surf
 
+    def _make_layer_surface(self, size, flags):
+        """
+        Create a surface for a pre-built layer (tiles, strips).
+
+        Opaque layers (flags 0) copy the pixel format of self.screen, so blitting
+        them each frame is a straight copy instead of a per-pixel format conversion.
+        """
+        if flags & pygame.SRCALPHA:
+            return pygame.Surface(size, pygame.SRCALPHA)
+        return pygame.Surface(size, 0, self.screen)
+
     def _prepare_tiled_textures(self):
         """Create cached tiled surfaces (matches JS set_clamp_s GL_REPEAT)."""
         self._track_tiled = None
+        self._track_strip = None
+        # Last (camera_x, camera_y) and the track layout computed for it
+        self._track_layout_camera = None
+        self._track_layout = None
         self._sand_tiled = None
         self._sandtape_tiled = None
         if self.track_texture is not None:
             seg_h = self.track_texture.get_height()
             self._track_tiled = self._tile_texture(self.track_texture, TRACK_TILE_WIDTH_PX, seg_h)
+            # All TRACK_SEGMENTS floor segments side by side, so _draw_track is one blit
+            self._track_strip = self._make_layer_surface(
+                ((TRACK_SEGMENTS - 1) * SCREEN_WIDTH + TRACK_TILE_WIDTH_PX, seg_h),
+                self._track_tiled.get_flags() & pygame.SRCALPHA,
+            )
+            for i in range(TRACK_SEGMENTS):
+                self._track_strip.blit(self._track_tiled, (i * SCREEN_WIDTH, 0))
         if self._sand_texture is not None:
             self._sand_tiled = self._tile_texture(self._sand_texture, 2000, 25)
         if self._sandtape_texture is not None:
@@ -239,13 +489,15 @@ class QWOPRenderer:
         if not os.path.exists(atlas_path) or not os.path.exists(json_path):
             return
         try:
-            self._ui_atlas = pygame.image.load(atlas_path).convert_alpha()
-            with open(json_path, 'r') as f:
-                data = json.load(f)
-            self._ui_frames = data.get('frames', [])
+            self._ui_atlas = _load_image(atlas_path, alpha=True)
+            self._ui_frames = _load_atlas_frames(json_path)
+            self._ui_frame_surfaces = [
+                self._atlas_subsurface(self._ui_atlas, fd) for fd in self._ui_frames
+            ]
         except (pygame.error, json.JSONDecodeError):
             self._ui_atlas = None
             self._ui_frames = None
+            self._ui_frame_surfaces = []
 
     def render(self, game):
         """
@@ -254,16 +506,32 @@ class QWOPRenderer:
         Args:
             game: QWOPGame instance with current state
         """
+        # Background, track, lane markers, sand pit, hurdle and body parts are all
+        # staged in depth order and issued as one batch
         if self._sprintbg_texture is not None:
-            self.screen.blit(self._sprintbg_texture, (0, -16))
+            self._frame_blits.append((self._sprintbg_texture, (0, -16)))
         else:
             self.screen.fill(self.colors['sky'])
 
         self._draw_background(game)
         self._draw_hurdle(game)
         self._draw_body_parts(game)
+        self._flush_blits()
+        # HUD layer: staged in draw order (shadows under text, overlay under panels)
+        # and issued as a second batch
         self._draw_hud(game)
         self._draw_key_indicators(game)
+        self._flush_blits()
+
+    def _flush_blits(self):
+        """Issue all staged (surface, dest) blits in order with one batch call."""
+        if not self._frame_blits:
+            return
+        if self._use_fblits:
+            self.screen.fblits(self._frame_blits)
+        else:
+            self.screen.blits(self._frame_blits, doreturn=0)
+        self._frame_blits.clear()
 
     def draw_observation_panel(self, screen, x, y, raw_obs, info):
         """
@@ -298,7 +566,7 @@ class QWOPRenderer:
 
         def _cell_text(text, cx, cy, cell_w, font=None, color=text_primary, align="left"):
             f = font or self.table_font
-            surf = f.render(str(text), True, color)
+            surf = self._render_cached(f, str(text), color)
             if align == "right":
                 px = cx + cell_w - surf.get_width() - pad
             elif align == "center":
@@ -307,7 +575,7 @@ class QWOPRenderer:
                 px = cx
             screen.blit(surf, (px, cy))
 
-        title = self.summary_font.render("OBSERVATION", True, text_secondary)
+        title = self._render_cached(self.summary_font, "OBSERVATION", text_secondary)
         screen.blit(title, (x + (panel_w - title.get_width()) // 2, row_y))
         row_y += 20
 
@@ -385,56 +653,78 @@ class QWOPRenderer:
     def _draw_track(self, game):
         """
         Draw track using underground.png segments (matches JS world_batcher floor sprites).
-        3 segments, each 640x(underground.height), positioned dynamically to stay under viewport.
+        TRACK_SEGMENTS segments, each 640x(underground.height), positioned dynamically to stay
+        under viewport, drawn as one pre-tiled strip.
         JS formula: world_x = (floor(camera_x/640) + i) * 640, centered: true.
         """
-        # Track center Y in world pixels: 10.74275 * WORLD_SCALE
-        track_center_y_px = 10.74275 * WORLD_SCALE
         segment_w = TRACK_TILE_WIDTH_PX
         segment_h = TRACK_HEIGHT_PX if self.track_texture is None else self.track_texture.get_height()
 
-        for i in range(3):
-            # JS floor position formula (line 863)
-            world_x_px = (math.floor(game.camera_x / SCREEN_WIDTH) + i) * SCREEN_WIDTH
-            screen_x = world_x_px - game.camera_x
-            screen_y = track_center_y_px - game.camera_y
+        # Positions depend only on the camera, which is often still (intro, fallen,
+        # standing); reuse the last layout when it has not moved
+        camera = (game.camera_x, game.camera_y)
+        if camera != self._track_layout_camera:
+            self._track_layout = self._compute_track_layout(camera[0], camera[1], segment_w, segment_h)
+            self._track_layout_camera = camera
+        blit_left, blit_top, track_top_y = self._track_layout
+
+        if self._track_strip is not None:
+            # Tiled texture (matches JS GL_REPEAT) - no stretching
+            self._frame_blits.append((self._track_strip, (blit_left, blit_top)))
+        else:
+            # Draws immediately, so flush what is staged underneath it first
+            self._flush_blits()
+            pygame.draw.rect(
+                self.screen,
+                self.colors['track'],
+                (blit_left, blit_top, (TRACK_SEGMENTS - 1) * SCREEN_WIDTH + segment_w, segment_h)
+            )
 
-            # Centered: true - blit with center at (screen_x, screen_y)
-            blit_left = int(screen_x - segment_w / 2)
-            blit_top = int(screen_y - segment_h / 2)
+        # Lane markers (Starting_Line from UISprites frame 17)
+        self._draw_lane_markers(game, track_top_y)
 
-            if self._track_tiled is not None:
-                # Tiled texture (matches JS GL_REPEAT) - no stretching
-                self.screen.blit(self._track_tiled, (blit_left, blit_top))
-            else:
-                pygame.draw.rect(
-                    self.screen,
-                    self.colors['track'],
-                    (blit_left, blit_top, segment_w, segment_h)
-                )
+    def _compute_track_layout(self, camera_x, camera_y, segment_w, segment_h):
+        """
+        Compute the track strip's blit position and the lane marker baseline.
 
-        # Lane markers (Starting_Line from UISprites frame 17)
-        track_top_y = track_center_y_px - segment_h / 2 - game.camera_y
-        self._draw_lane_markers(game, int(track_top_y))
+        Args:
+            camera_x: Camera X in pixels
+            camera_y: Camera Y in pixels
+            segment_w: Floor segment width in pixels
+            segment_h: Floor segment height in pixels
+
+        Returns:
+            (blit_left, blit_top, track_top_y) tuple of ints in screen pixels
+        """
+        # Track center Y in world pixels: 10.74275 * WORLD_SCALE
+        track_center_y_px = 10.74275 * WORLD_SCALE
+
+        # JS floor position formula (line 863) for the first segment; the rest
+        # follow at SCREEN_WIDTH spacing and are pre-baked into _track_strip
+        world_x_px = math.floor(camera_x / SCREEN_WIDTH) * SCREEN_WIDTH
+        screen_x = world_x_px - camera_x
+        screen_y = track_center_y_px - camera_y
+
+        # Centered: true - blit with center at (screen_x, screen_y)
+        blit_left = int(screen_x - segment_w / 2)
+        blit_top = int(screen_y - segment_h / 2)
+
+        track_top_y = track_center_y_px - segment_h / 2 - camera_y
+        return (blit_left, blit_top, int(track_top_y))
 
     def _draw_lane_markers(self, game, track_y):
         """Draw start line and best line only (matches JS: startingLine at 90, hsLine at highScore*10*worldScale)."""
-        if self._ui_atlas is None or self._ui_frames is None or len(self._ui_frames) <= 17:
+        surf = self._lane_marker_surf
+        if surf is None:
             return
-        fd = self._ui_frames[17]
-        fr = fd['frame']
-        rect = pygame.Rect(fr['x'], fr['y'], fr['w'], fr['h'])
-        surf = self._ui_atlas.subsurface(rect).copy()
-        # Scale to (37, 77) to match JS startingLine size (spriteSourceSize.w, 0.7 * spriteSourceSize.h)
-        marker_w, marker_h = 37, 77
-        surf = pygame.transform.smoothscale(surf, (marker_w, marker_h))
+        marker_w, marker_h = LANE_MARKER_SIZE
         marker_bottom = track_y
         blit_y = marker_bottom - marker_h
 
         def _draw_marker_if_visible(world_x):
             screen_x = world_x - game.camera_x
             if screen_x + marker_w > 0 and screen_x < SCREEN_WIDTH:
-                self.screen.blit(surf, (int(screen_x), int(blit_y)))
+                self._frame_blits.append((surf, (int(screen_x), int(blit_y))))
 
         # Start line: JS startingLine at (90, 144) world pixels
         start_line_world_x = 90
@@ -445,41 +735,67 @@ class QWOPRenderer:
             best_line_world_x = game.game_state.high_score * 10 * WORLD_SCALE
             _draw_marker_if_visible(best_line_world_x)
 
-    def _draw_sand_pit(self, game):
-        """Draw sand pit elements at SAND_PIT_AT when in view."""
-        if not (SAND_PIT_AT - 500 < game.camera_x < SAND_PIT_AT + 2100):
-            return
-        # Transform: screen = world - camera (all in pixels)
-        def to_screen(wx, wy):
-            return (wx - game.camera_x, wy - game.camera_y)
+    def _build_sandpit_composite(self):
+        """
+        Pre-composite the four static sand pit elements into one surface.
 
+        Element positions are JS world pixels relative to SANDPIT_ORIGIN. Layers are
+        stacked with premultiplied "over", then converted back to straight alpha so
+        an ordinary alpha blit of the result matches drawing them one by one.
+        """
+        self._sandpit_composite = None
+        layers = []
         # 1. sandpitTape (sandtape.png): pos (19916, 160), size 2000 x 14 (JS GL_REPEAT)
         if self._sandtape_tiled is not None:
-            sx, sy = to_screen(SAND_PIT_AT - 84, 160)
-            self.screen.blit(self._sandtape_tiled, (int(sx), int(sy)))
-
+            layers.append((self._sandtape_tiled, (SAND_PIT_AT - 84, 160)))
         # 2. sandpitSandBody (sand.png): pos (19994, 176), size 2000 x 25 (JS GL_REPEAT)
         if self._sand_tiled is not None:
-            sx, sy = to_screen(SAND_PIT_AT - 6, 176)
-            self.screen.blit(self._sand_tiled, (int(sx), int(sy)))
-
+            layers.append((self._sand_tiled, (SAND_PIT_AT - 6, 176)))
         # 3. sandpitSandHead (UISprites frame 24, 72x25): pos (20000, 188.5)
-        if self._ui_atlas is not None and self._ui_frames is not None and len(self._ui_frames) > 24:
-            fd = self._ui_frames[24]
-            fr = fd['frame']
-            rect = pygame.Rect(fr['x'], fr['y'], fr['w'], fr['h'])
-            surf = self._ui_atlas.subsurface(rect).copy()
-            sx, sy = to_screen(SAND_PIT_AT, 188.5)
-            self.screen.blit(surf, (int(sx), int(sy)))
-
+        if len(self._ui_frame_surfaces) > 24:
+            layers.append((self._ui_frame_surfaces[24], (SAND_PIT_AT, 188.5)))
         # 4. SandBoard (UISprites frame 16, 366x110): pos (19817, 155)
-        if self._ui_atlas is not None and self._ui_frames is not None and len(self._ui_frames) > 16:
-            fd = self._ui_frames[16]
-            fr = fd['frame']
-            rect = pygame.Rect(fr['x'], fr['y'], fr['w'], fr['h'])
-            surf = self._ui_atlas.subsurface(rect).copy()
-            sx, sy = to_screen(SAND_PIT_AT - 183, 155)
-            self.screen.blit(surf, (int(sx), int(sy)))
+        if len(self._ui_frame_surfaces) > 16:
+            layers.append((self._ui_frame_surfaces[16], (SAND_PIT_AT - 183, 155)))
+        if not layers:
+            return
+
+        origin_x, origin_y = SANDPIT_ORIGIN
+        composite = pygame.Surface(SANDPIT_SIZE, pygame.SRCALPHA)
+        for surf, (wx, wy) in layers:
+            # convert_alpha() first: gives opaque layers an alpha channel, and
+            # premul_alpha() misreads the pitch of atlas subsurfaces
+            composite.blit(
+                surf.convert_alpha().premul_alpha(), (int(wx - origin_x), int(wy - origin_y)),
+                special_flags=pygame.BLEND_PREMULTIPLIED,
+            )
+
+        # Un-premultiply in place (transparent pixels stay black)
+        rgb = pygame.surfarray.pixels3d(composite)
+        alpha = pygame.surfarray.pixels_alpha(composite)[..., None].astype(np.float32)
+        straight = np.rint(rgb * 255.0 / np.maximum(alpha, 1.0))
+        rgb[...] = np.where(alpha > 0, np.minimum(straight, 255.0), 0.0).astype(np.uint8)
+        del rgb  # release the surface lock
+        self._sandpit_composite = composite
+
+    def _draw_sand_pit(self, game):
+        """Draw the pre-composited sand pit at SAND_PIT_AT when in view."""
+        if self._sandpit_composite is None:
+            return
+        # Same camera memo as the track layout: the staged blit (or None when out
+        # of view) only changes when the camera moves
+        camera = (game.camera_x, game.camera_y)
+        if camera != self._sandpit_blit_camera:
+            self._sandpit_blit = None
+            # Transform: screen = world - camera (all in pixels)
+            sx = SANDPIT_ORIGIN[0] - camera[0]
+            sy = SANDPIT_ORIGIN[1] - camera[1]
+            # Exact viewport test on the composite's bounds
+            if -SANDPIT_SIZE[0] < sx < SCREEN_WIDTH and -SANDPIT_SIZE[1] < sy < SCREEN_HEIGHT:
+                self._sandpit_blit = (self._sandpit_composite, (int(sx), int(sy)))
+            self._sandpit_blit_camera = camera
+        if self._sandpit_blit is not None:
+            self._frame_blits.append(self._sandpit_blit)
 
     def _draw_hurdle(self, game):
         """
@@ -494,64 +810,55 @@ class QWOPRenderer:
         
         # Draw hurdle base
         if game.physics.hurdle_base is not None:
-            base_body = game.physics.hurdle_base
-            base_width_px = HURDLE_BASE_SIZE[0]
-            base_height_px = HURDLE_BASE_SIZE[1]
-            
             self._draw_hurdle_part(
-                base_body, 
-                base_width_px, 
-                base_height_px, 
-                self.colors['hurdle_base'],
-                game
+                game.physics.hurdle_base, self._hurdle_base_surf, self._hurdle_base_rotations, game
             )
         
         # Draw hurdle top
         if game.physics.hurdle_top is not None:
-            top_body = game.physics.hurdle_top
-            top_width_px = HURDLE_TOP_SIZE[0]
-            top_height_px = HURDLE_TOP_SIZE[1]
-            
             self._draw_hurdle_part(
-                top_body,
-                top_width_px,
-                top_height_px,
-                self.colors['hurdle_top'],
-                game
+                game.physics.hurdle_top, self._hurdle_top_surf, self._hurdle_top_rotations, game
             )
     
-    def _draw_hurdle_part(self, body, width_px, height_px, color, game):
+    def _draw_hurdle_part(self, body, surf, rotations, game):
         """
         Draw a single hurdle part as a rotated rectangle.
         
         Args:
             body: Box2D body (b2Body)
-            width_px: Width in pixels
-            height_px: Height in pixels
-            color: RGB tuple
+            surf: Pre-filled unrotated surface for this part (see _make_rect_surface)
+            rotations: This part's dense rotation cache (SPRITE_ROTATION_BINS slots)
             game: QWOPGame instance
         """
-        # Create surface for this hurdle part
-        surf = pygame.Surface((width_px, height_px), pygame.SRCALPHA)
-        surf.fill(color)
+        # Get center position in world coords (bind once; unpacking goes through __iter__)
+        pos = body.position
+        world_x = pos.x
+        world_y = pos.y
         
-        # Rotate the surface
+        # Transform to screen coords (screen = world * WORLD_SCALE - camera)
+        screen_x = world_x * WORLD_SCALE - game.camera_x
+        screen_y = world_y * WORLD_SCALE - game.camera_y
+
+        # Skip the rotation entirely when the rotated part cannot reach the viewport
+        half_diagonal = math.hypot(*surf.get_size()) / 2 + 1
+        if (abs(screen_x - SCREEN_HALF_SIZE[0]) > SCREEN_HALF_SIZE[0] + half_diagonal
+                or abs(screen_y - SCREEN_HALF_SIZE[1]) > SCREEN_HALF_SIZE[1] + half_diagonal):
+            return
+
+        # Rotate the surface, cached on the same angle bins as body sprites
         # Pygame rotates counter-clockwise, Box2D angle is in radians
         # Need to negate angle for correct rotation
-        angle_degrees = -math.degrees(body.angle)
-        rotated = pygame.transform.rotate(surf, angle_degrees)
-        
-        # Get center position in world coords
-        world_x, world_y = body.position
-        
-        # Transform to screen coords
-        screen_x, screen_y = self._world_to_screen(world_x, world_y, game)
+        angle_bin = round(body.angle * -SPRITE_BINS_PER_RADIAN) % SPRITE_ROTATION_BINS
+        rotated = rotations[angle_bin]
+        if rotated is None:
+            rotated = pygame.transform.rotate(surf, angle_bin * (360 / SPRITE_ROTATION_BINS))
+            rotations[angle_bin] = rotated
         
         # Get rotated rect to properly center it
         rotated_rect = rotated.get_rect(center=(screen_x, screen_y))
         
         # Draw
-        self.screen.blit(rotated, rotated_rect)
+        self._frame_blits.append((rotated, rotated_rect))
     
     def _draw_body_parts(self, game):
         """
@@ -561,105 +868,92 @@ class QWOPRenderer:
         Args:
             game: QWOPGame instance
         """
-        use_sprites = self._player_atlas is not None and self._player_frames is not None
-        # Draw in depth order (back to front)
-        for body_name in self.render_order:
-            body = game.physics.get_body(body_name)
-            if body is None:
-                continue
+        draw_list = self._get_draw_list(game)
+        if not draw_list:
+            return
 
-            config = BODY_PARTS[body_name]
-            if use_sprites:
-                self._draw_body_sprite(body, config, body_name, game)
-            else:
-                color = self.body_colors.get(body_name, (128, 128, 128))
-                self._draw_body_rect(body, config, color, game)
-    
-    def _draw_body_sprite(self, body, config, body_name, game):
-        """
-        Draw a single body part using a sprite from the playercolor atlas.
+        # Read every part's (x, y, angle) from Box2D into one (N, 3) array
+        state = []
+        for entry in draw_list:
+            body = entry[1]
+            pos = body.position
+            state += (pos.x, pos.y, body.angle)
+        state = np.array(state, dtype=np.float64).reshape(-1, 3)
+
+        # World-to-screen for all parts in one batch: (N, 2) positions * scale - camera
+        positions = state[:, :2]
+        positions *= WORLD_SCALE
+        positions -= (game.camera_x, game.camera_y)
+        screen_positions = positions.tolist()
+
+        # Rotation bin per part (pygame CCW degrees vs Box2D radians, hence the
+        # negative scale): index into that part's rotation table
+        angle_bins = np.rint(state[:, 2] * self._draw_list_bin_scale)
+        np.mod(angle_bins, self._draw_list_bin_counts, out=angle_bins)
+        angle_bins = angle_bins.astype(np.intp).tolist()
+
+        # Cull parts whose rotated bounds cannot reach the viewport (before rotate/blit)
+        positions -= SCREEN_HALF_SIZE
+        np.abs(positions, out=positions)
+        visible = (positions <= self._draw_list_extents).all(axis=1).tolist()
+
+        # Draw in depth order (back to front). Sprite tables fill on first use;
+        # fallback rect tables are complete (see _build_body_rect_rotations)
+        frame_blits = self._frame_blits
+        for (_, _, _, base_surf, rotations), screen_pos, angle_bin, is_visible in zip(
+            draw_list, screen_positions, angle_bins, visible
+        ):
+            if not is_visible:
+                continue
+            rotated = rotations[angle_bin]
+            if rotated is None:
+                rotated = pygame.transform.rotate(base_surf, angle_bin * (360 / len(rotations)))
+                rotations[angle_bin] = rotated
+            frame_blits.append((rotated, rotated.get_rect(center=screen_pos)))
 
-        Args:
-            body: Box2D body (b2Body)
-            config: Body part config dict from BODY_PARTS
-            body_name: Body part name (e.g. 'torso', 'leftFoot')
-            game: QWOPGame instance
+    def _get_draw_list(self, game):
         """
-        frame_idx = BODY_PART_TO_FRAME_INDEX.get(body_name)
-        if frame_idx is None or frame_idx >= len(self._player_frames):
-            return
-        frame_data = self._player_frames[frame_idx]
-        fr = frame_data['frame']
-        rect = pygame.Rect(fr['x'], fr['y'], fr['w'], fr['h'])
-        surf = self._player_atlas.subsurface(rect).copy()
-
-        # Scale to physics dimensions (same as colored rect path)
-        width_px = config['half_width'] * 2 * WORLD_SCALE
-        height_px = config['half_height'] * 2 * WORLD_SCALE
-        if surf.get_width() != width_px or surf.get_height() != height_px:
-            surf = pygame.transform.smoothscale(surf, (int(width_px), int(height_px)))
+        Get the (body_name, body, config, base_surf, rotations) draw list in render order.
 
-        # Rotate (pygame CCW, Box2D radians)
-        angle_degrees = -math.degrees(body.angle)
-        rotated = pygame.transform.rotate(surf, angle_degrees)
+        Each entry is a _render_plan entry with the physics body filled in.
 
-        world_x, world_y = body.position
-        screen_x, screen_y = self._world_to_screen(world_x, world_y, game)
-        rotated_rect = rotated.get_rect(center=(screen_x, screen_y))
-        self.screen.blit(rotated, rotated_rect)
+        Resolved once and reused across frames. PhysicsWorld.reset() recreates all
+        player bodies together, so checking the first entry is enough to detect a
+        stale list (after a reset or when rendering a different game).
 
-    def _draw_body_rect(self, body, config, color, game):
-        """
-        Draw a single body part as a rotated rectangle (fallback when sprites unavailable).
-        
         Args:
-            body: Box2D body (b2Body)
-            config: Body part config dict from BODY_PARTS
-            color: RGB tuple
             game: QWOPGame instance
-        """
-        # Get body dimensions in pixels
-        width_px = config['half_width'] * 2 * WORLD_SCALE
-        height_px = config['half_height'] * 2 * WORLD_SCALE
-        
-        # Create surface for this body part
-        surf = pygame.Surface((width_px, height_px), pygame.SRCALPHA)
-        surf.fill(color)
-        
-        # Rotate the surface
-        # Pygame rotates counter-clockwise, Box2D angle is in radians
-        # Need to negate angle for correct rotation
-        angle_degrees = -math.degrees(body.angle)
-        rotated = pygame.transform.rotate(surf, angle_degrees)
-        
-        # Get center position in world coords
-        world_x, world_y = body.position
-        
-        # Transform to screen coords
-        screen_x, screen_y = self._world_to_screen(world_x, world_y, game)
-        
-        # Get rotated rect to properly center it
-        rotated_rect = rotated.get_rect(center=(screen_x, screen_y))
-        
-        # Draw
-        self.screen.blit(rotated, rotated_rect)
-    
-    def _world_to_screen(self, world_x, world_y, game):
-        """
-        Transform world coordinates to screen coordinates.
-        
-        Args:
-            world_x: X position in world/Box2D coordinates (meters)
-            world_y: Y position in world/Box2D coordinates (meters)
-            game: QWOPGame instance (for camera position)
-            
+
         Returns:
-            (screen_x, screen_y) tuple in pixels
+            List of (body_name, b2Body, config, base_surf, rotations) tuples
         """
-        screen_x = (world_x * WORLD_SCALE) - game.camera_x
-        screen_y = (world_y * WORLD_SCALE) - game.camera_y
-        return (screen_x, screen_y)
+        draw_list = self._draw_list
+        if draw_list and game.physics.bodies.get(draw_list[0][0]) is draw_list[0][1]:
+            return draw_list
 
+        draw_list = []
+        for body_name, config, base_surf, rotations in self._render_plan:
+            body = game.physics.get_body(body_name)
+            if body is not None:
+                draw_list.append((body_name, body, config, base_surf, rotations))
+        self._draw_list = draw_list
+
+        # Largest |screen pos - screen center| at which each part can still overlap
+        # the viewport: half the screen plus the part's half-diagonal (any rotation)
+        half_diagonals = np.array(
+            [math.hypot(config['half_width'], config['half_height']) * WORLD_SCALE + 1
+             for _, _, config, _, _ in draw_list],
+            dtype=np.float64,
+        ).reshape(-1, 1)
+        self._draw_list_extents = half_diagonals + SCREEN_HALF_SIZE
+
+        # Per-part rotation table size and (negated) bins per radian
+        self._draw_list_bin_counts = np.array(
+            [len(rotations) for _, _, _, _, rotations in draw_list], dtype=np.float64
+        )
+        self._draw_list_bin_scale = self._draw_list_bin_counts / (-2 * math.pi)
+        return draw_list
+    
     def _blit_ui_frame(self, frame_idx, screen_x, screen_y, centered=True):
         """
         Blit a UI atlas frame at screen position.
@@ -673,21 +967,16 @@ class QWOPRenderer:
         """
         if self._ui_atlas is None or self._ui_frames is None or frame_idx >= len(self._ui_frames):
             return
-        fd = self._ui_frames[frame_idx]
-        fr = fd['frame']
-        rect = pygame.Rect(fr['x'], fr['y'], fr['w'], fr['h'])
-        surf = self._ui_atlas.subsurface(rect).copy()
+        surf = self._ui_frame_surfaces[frame_idx]
         if centered:
             blit_rect = surf.get_rect(center=(screen_x, screen_y))
         else:
             blit_rect = surf.get_rect(topleft=(screen_x, screen_y))
-        self.screen.blit(surf, blit_rect)
+        self._frame_blits.append((surf, blit_rect))
 
     def _draw_black_overlay(self):
         """Draw semi-transparent black overlay (0.6 alpha) over full screen."""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 153))  # 0.6 * 255 ≈ 153
-        self.screen.blit(overlay, (0, 0))
+        self._frame_blits.append((self._black_overlay, (0, 0)))
     
     def _draw_hud(self, game):
         """
@@ -800,7 +1089,26 @@ class QWOPRenderer:
         )
 
     def _draw_key_button(self, key_char, is_pressed, x, y, size):
-        """Draw a single key button with embossed/physical look."""
+        """Draw a single key button with embossed/physical look (pre-rendered per state)."""
+        key = (key_char, is_pressed, size)
+        surf = self._key_surfs.get(key)
+        if surf is None:
+            surf = self._build_key_button(key_char, is_pressed, size)
+            self._key_surfs[key] = surf
+        self._frame_blits.append((surf, (x, y)))
+
+    def _build_key_button(self, key_char, is_pressed, size):
+        """
+        Render one fallback key button (fill, border, highlight, letter) to a surface.
+
+        The surface is one pixel larger than the button on each axis because the
+        highlight lines end at (size, 0) and (0, size); that margin stays transparent.
+
+        Returns:
+            pygame.Surface (SRCALPHA) to blit with its top-left at the button position
+        """
+        surf = pygame.Surface((size + 1, size + 1), pygame.SRCALPHA)
+        x, y = 0, 0
         key_rect = pygame.Rect(x, y, size, size)
 
         if is_pressed:
@@ -811,19 +1119,20 @@ class QWOPRenderer:
             text_color = (80, 80, 80)
 
         # Main fill
-        pygame.draw.rect(self.screen, bg_color, key_rect)
+        pygame.draw.rect(surf, bg_color, key_rect)
         # Border for physical button look
         border_color = (220, 220, 220) if not is_pressed else (120, 120, 120)
-        pygame.draw.rect(self.screen, border_color, key_rect, 1)
+        pygame.draw.rect(surf, border_color, key_rect, 1)
         # Top-left highlight for embossed look
         if not is_pressed:
-            pygame.draw.line(self.screen, (230, 230, 230), (x, y), (x + size, y), 1)
-            pygame.draw.line(self.screen, (230, 230, 230), (x, y), (x, y + size), 1)
+            pygame.draw.line(surf, (230, 230, 230), (x, y), (x + size, y), 1)
+            pygame.draw.line(surf, (230, 230, 230), (x, y), (x, y + size), 1)
 
         # Key letter
         text_surf = self.font.render(key_char, True, text_color)
         text_rect = text_surf.get_rect(center=key_rect.center)
-        self.screen.blit(text_surf, text_rect)
+        surf.blit(text_surf, text_rect)
+        return surf
     
     def _draw_text_with_shadow(self, text, font, x, y, color, center=False, right_align=False):
         """
@@ -838,8 +1147,10 @@ class QWOPRenderer:
             center: If True, center text at (x, y)
             right_align: If True, right-align text at x
         """
+        shadow_surf = self._render_cached(font, text, self.colors['text_shadow'])
+        text_surf = self._render_cached(font, text, color)
+
         # Draw shadow (1px offset - subtle outline matching JS)
-        shadow_surf = font.render(text, True, self.colors['text_shadow'])
         shadow_rect = shadow_surf.get_rect()
         
         if center:
@@ -849,10 +1160,9 @@ class QWOPRenderer:
         else:
             shadow_rect.topleft = (x + 1, y + 1)
         
-        self.screen.blit(shadow_surf, shadow_rect)
+        self._frame_blits.append((shadow_surf, shadow_rect))
         
         # Draw actual text
-        text_surf = font.render(text, True, color)
         text_rect = text_surf.get_rect()
         
         if center:
@@ -862,4 +1172,29 @@ class QWOPRenderer:
         else:
             text_rect.topleft = (x, y)
         
-        self.screen.blit(text_surf, text_rect)
+        self._frame_blits.append((text_surf, text_rect))
+
+    def _render_cached(self, font, text, color):
+        """
+        Render antialiased text, reusing the surface if this (font, text, color) was seen before.
+
+        The HUD strings are formatted to 1 decimal, so the same few strings recur
+        frame-to-frame. The cache is bounded by TEXT_CACHE_SIZE (least recently used evicted).
+
+        Args:
+            font: pygame.font.Font instance
+            text: String to render
+            color: RGB tuple for text color
+
+        Returns:
+            pygame.Surface with the rendered text (do not modify - it is shared)
+        """
+        key = (font, text, color)
+        surf = self._text_cache.pop(key, None)
+        if surf is None:
+            surf = font.render(text, True, color)
+            if len(self._text_cache) >= TEXT_CACHE_SIZE:
+                del self._text_cache[next(iter(self._text_cache))]
+        # (Re)insert at the end so dict order tracks recency
+        self._text_cache[key] = surf
+        return surf
@@ -44,8 +44,12 @@ ALLOWED_ENV_KWARGS = {
     "speed_rew_mult",
     "render_mode",
     "show_observation_panel",
+    "obs_dtype",
 }
 
+# Same safe subset as yaml.SafeLoader, parsed by libyaml when it is available
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class Clock:
     """A better alternative to pygame.Clock for our use-case"""
@@ -53,10 +57,10 @@ class Clock:
     def __init__(self, fps):
         self.fps = fps
         self.min_interval = 1 / fps
-        self.last_tick_at = time.time()
+        self.last_tick_at = time.perf_counter()
 
     def tick(self):
-        tick_at = time.time()
+        tick_at = time.perf_counter()
         interval = tick_at - self.last_tick_at
         sleep_for = self.min_interval - interval
 
@@ -81,12 +85,17 @@ class Replayer:
         return (action, None)
 
 
+def load_yaml(stream):
+    """Parse a YAML document like yaml.safe_load, using YAML_LOADER."""
+    return yaml.load(stream, Loader=YAML_LOADER)
+
+
 def expand_env_kwargs(env_kwargs):
     env_include_cfg = env_kwargs.pop("__include__", None)
 
     if env_include_cfg:
         with open(env_include_cfg, "r") as f:
-            env_kwargs = yaml.safe_load(f) | env_kwargs
+            env_kwargs = load_yaml(f) | env_kwargs
 
     return env_kwargs
 
@@ -299,8 +308,8 @@ def play_model(env, fps, steps_per_step, model, obs):
     clock = Clock(fps)
 
     while not terminated:
-        _check_pygame_quit(env)
         action, _states = model.predict(obs)
+        # Drain events once per rendered frame
         for _ in range(steps_per_step):
             _check_pygame_quit(env)
             obs, reward, terminated, truncated, info = env.step(action)
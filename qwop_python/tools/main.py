@@ -20,8 +20,6 @@ import os
 import sys
 from copy import deepcopy
 
-import yaml
-
 from . import common
 
 
@@ -246,7 +244,7 @@ examples:
 
     print("Loading configuration from %s" % config_path)
     with open(config_path, "r") as f:
-        cfg = yaml.safe_load(f) or {}
+        cfg = common.load_yaml(f) or {}
 
     if args.run_id is not None:
         cfg["run_id"] = args.run_id
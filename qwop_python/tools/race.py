@@ -251,13 +251,12 @@ def race(cfg):
             terminated_b = False
 
             while not (terminated_a and terminated_b):
-                _check_pygame_quit()
-
                 if not terminated_a:
                     action_a, _ = model_a.predict(obs_a)
                 if not terminated_b:
                     action_b, _ = model_b.predict(obs_b)
 
+                # Drain events once per rendered frame
                 for _ in range(steps_per_step):
                     _check_pygame_quit()
 